@@ -15,10 +15,35 @@ The main issues being addressed include implementing persistent data storage via
 and keeping code organized with proper class hierarchy.
 
 """
+import os
+import io
 import sys
+import csv
 import datetime
 import random
+from collections import deque
 
+# Rock-paper-scissors moves, their indexes and the winning (player, opponent) index pairs.
+_RPS = ('rock', 'paper', 'scissors')
+_RPS_INDEX = {'rock': 0, 'paper': 1, 'scissors': 2}
+_WIN = {(0, 2), (1, 0), (2, 1)}
+
+# Clock and display format for battle timestamps.
+_NOW = datetime.datetime.now
+_TS_FMT = '%d/%m/%Y %I:%M%p'
+
+# Parsed CSV rows keyed by (absolute path, modification time), reused on repeated setup.
+_CSV_CACHE = {}
+
+
+# Prompts for a line of input through buffered stdin, used in place of input() in the game loops.
+def _prompt(message):
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
 
 
 # Custom exception for handling invalid movement directions.
@@ -33,17 +58,23 @@ class InvalidDirectionException(Exception):
 # Custom exception for handling invalid CSV file formats.
 class InvalidInputFileFormat(Exception):
 
-    def __init__(self, filename):
+    def __init__(self, filename, details=None):
 
         self.filename = filename
+        self.details = details
         self.message = f"Error: {filename} Csv file has invalid content or in incorrect format."
+        if details:
+            self.message += f" {details}"
         super().__init__(self.message)
 
 # Tracks and manages battle statistics for Pymons.
 class BattleStats:
+
+    __slots__ = ('battles',)
+
     def __init__(self):
 
-        # Dictionary to store battle history for each Pymon
+        # Dictionary to store battle history and running totals for each Pymon
         self.battles = {} 
 
 
@@ -51,43 +82,46 @@ class BattleStats:
     def add_battle(self, pymon_name, opponent, wins, draws, losses):
 
         if pymon_name not in self.battles:
-            self.battles[pymon_name] = []
+            self.battles[pymon_name] = {'battles': [], 'wins': 0, 'draws': 0, 'losses': 0}
             
-        battle_time = datetime.datetime.now()
         battle = {
-            'timestamp': battle_time,
+            'timestamp': _NOW().strftime(_TS_FMT), # Formatted once when recorded
             'opponent': opponent,
             'wins': wins,
             'draws': draws,
             'losses': losses
         }
-        self.battles[pymon_name].append(battle)
+        entry = self.battles[pymon_name]
+        entry['battles'].append(battle)
+        entry['wins'] += wins
+        entry['draws'] += draws
+        entry['losses'] += losses
 
     # Generate battle stats for each Pymon.  
     def stats_generate(self):
 
-        for pymon_name, battles in self.battles.items():
+        out = [] # Output lines, written with a single print
+        for pymon_name, entry in self.battles.items():
 
-            print(f"\nPymon Nickname: \"{pymon_name}\"")
-            total_wins = 0
-            total_draws = 0
-            total_losses = 0
+            out.append(f"\nPymon Nickname: \"{pymon_name}\"")
             
-            for battle in battles:
-                print(f"Battle {len(battles)}, {battle['timestamp'].strftime('%d/%m/%Y %I:%M%p')} "
-                      f"Opponent: \"{battle['opponent']}\", W: {battle['wins']} "
-                      f"D: {battle['draws']} L: {battle['losses']}")
-                      
-                total_wins += battle['wins']
-                total_draws += battle['draws']
-                total_losses += battle['losses']
+            for battle_num, battle in enumerate(entry['battles'], 1):
+                out.append(f"Battle {battle_num}, {battle['timestamp']} "
+                           f"Opponent: \"{battle['opponent']}\", W: {battle['wins']} "
+                           f"D: {battle['draws']} L: {battle['losses']}")
                 
-            print(f"Total: W: {total_wins} D: {total_draws} L: {total_losses}")
+            out.append(f"Total: W: {entry['wins']} D: {entry['draws']} L: {entry['losses']}")
+
+        if out:
+            print('\n'.join(out))
 
 
 # Represents a location in the game world.
 class Location:
 
+    __slots__ = ('name', 'description', 'doors', 'creatures', 'items',
+                 '_creatures_by_name', '_items_by_name', '_neighbors')
+
     # Initialize a new location.
     def __init__(self, name = "New room", description = "", w = None, n = None , e = None, s = None):
         self.name = name
@@ -97,17 +131,46 @@ class Location:
         self.doors["north"] = n
         self.doors["east"] = e
         self.doors["south"] = s
+        self._neighbors = [door for door in self.doors.values() if door is not None] # Connected locations
         self.creatures = [] # List of creatures in this location
         self.items = []  # List of items in this location
+        self._creatures_by_name = {} # Creatures indexed by lowercased nickname
+        self._items_by_name = {} # Items indexed by lowercased name
 
     # Adds a creature to the location
     def add_creature(self, creature):
         self.creatures.append(creature)
+        self._creatures_by_name[creature.nickname_lc] = creature
         
         
     # Adds a item to the location    
     def add_item(self, item):
         self.items.append(item)
+        self._items_by_name[item._name_lc] = item
+
+    # Removes a creature from the location
+    def remove_creature(self, creature):
+        self.creatures.remove(creature)
+        key = creature.nickname_lc
+        if self._creatures_by_name.get(key) is creature:
+            # Falls back to another creature sharing the same nickname, if any.
+            replacement = next((c for c in self.creatures if c.nickname_lc == key), None)
+            if replacement:
+                self._creatures_by_name[key] = replacement
+            else:
+                del self._creatures_by_name[key]
+
+    # Removes a item from the location
+    def remove_item(self, item):
+        self.items.remove(item)
+        key = item._name_lc
+        if self._items_by_name.get(key) is item:
+            # Falls back to another item sharing the same name, if any.
+            replacement = next((i for i in self.items if i._name_lc == key), None)
+            if replacement:
+                self._items_by_name[key] = replacement
+            else:
+                del self._items_by_name[key]
         
     # Connects the location to another location    
     def connect(self, direction, another_room):
@@ -115,11 +178,16 @@ class Location:
         opposite_directions = {"west": "east", "east": "west", "north": "south", "south": "north"}
         
         
-        self.doors[direction] = another_room
+        self.set_door(direction, another_room)
         
         if direction in opposite_directions:
             opposite = opposite_directions[direction]
-            another_room.doors[opposite] = self
+            another_room.set_door(opposite, self)
+
+    # Assigns a door and refreshes the cached list of connected locations.
+    def set_door(self, direction, another_room):
+        self.doors[direction] = another_room
+        self._neighbors = [door for door in self.doors.values() if door is not None]
         
     def get_name(self):
         return self.name
@@ -137,9 +205,12 @@ class Location:
 # Represents an item in the game that can be collected and used by Pymons.
 class Item:
 
+    __slots__ = ('_name', '_description', 'pick_up_items', 'consumable', '_name_lc')
+
     # Initialize a new item.
     def __init__(self, name, description, pick_up_items, consumable):
         self._name = name
+        self._name_lc = name.lower() # Cached for case-insensitive lookups
         self._description = description
         self.pick_up_items = pick_up_items
         self.consumable = consumable
@@ -147,7 +218,7 @@ class Item:
     def name(self):
         return self._name
     
-    def pick_up_items(self):
+    def is_pickable(self):
         return self.pick_up_items
     
     def is_consumable(self):
@@ -157,8 +228,12 @@ class Item:
 
 # Represents creature in the game
 class Creature:
+
+    __slots__ = ('nickname', 'nickname_lc', 'description', 'location', 'adoptable')
+
     def __init__(self, nickname, description, location, adoptable = False):
         self.nickname = nickname
+        self.nickname_lc = nickname.lower() # Cached for case-insensitive lookups
         self.description = description
         self.location = location 
         self.adoptable = adoptable
@@ -173,6 +248,8 @@ class Creature:
 # Represents the player controlled Pymon character.
 class Pymon(Creature):
 
+    __slots__ = ('current_location', 'energy', '_inventory', 'pets', 'track_moves', 'immunity', 'battle_stats')
+
     enery_max = 3 # Maximum energy level for any Pymon
 
     # Initialize a new Pymon.
@@ -181,8 +258,8 @@ class Pymon(Creature):
         super().__init__(nickname=name, description=description, location=current_location)
         self.current_location = current_location  
         self.energy = 3  # Starting energy level
-        self._inventory = [] # List of picked items
-        self.pets = [] # List of captured Pymons
+        self._inventory = {} # Picked items, lowercased name -> list of items
+        self.pets = deque() # Captured Pymons
         self.track_moves = 0 # Movement-based energy consumption
         self.immunity = False # Battle immunity status
         self.battle_stats = BattleStats()   
@@ -199,7 +276,7 @@ class Pymon(Creature):
                     
                 
                     if self in self.current_location.creatures:
-                        self.current_location.creatures.remove(self)
+                        self.current_location.remove_creature(self)
                         
                     new_location.add_creature(self) 
                     self.current_location = new_location  
@@ -222,8 +299,11 @@ class Pymon(Creature):
     def random_escape(self):
 
         # Moving the pymon to a random location when energy is depleted.
-        random_location = random.choice(self.current_location.doors.values())
-        self.current_location.creatures.remove(self)
+        neighbors = self.current_location._neighbors
+        if not neighbors:
+            return
+        random_location = random.choice(neighbors)
+        self.current_location.remove_creature(self)
         random_location.add_creature(self)
         self.current_location = random_location
         print(f"{self.nickname} has escaped to a random location due to lack of energy.")
@@ -232,16 +312,18 @@ class Pymon(Creature):
     def use_item(self, item_name):
 
         # Uses the item available in the inventory.
-        item = next((i for i in self._inventory if i._name.lower() == item_name.lower()), None)
+        stack = self._inventory.get(item_name.lower())
+        item = stack[-1] if stack else None
         if not item:
             print(f"This {item_name} is not in your inventory.")
             return
         
-        if item._name.lower() == "apple":
+        item_name_lc = item._name_lc
+        if item_name_lc == "apple":
 
             if self.energy < Pymon.enery_max:
                 self.energy += 1
-                self._inventory.remove(item)
+                self._remove_from_inventory(item)
 
                 print("Your pymon ate the apple. Energy increased by 1")
 
@@ -249,16 +331,24 @@ class Pymon(Creature):
 
                 print("Energy is already at maximum.")
 
-        elif item._name.lower() == "magic potion":
+        elif item_name_lc == "magic potion":
             self.immunity = True
-            self._inventory.remove(item)  
+            self._remove_from_inventory(item)
             print("Drinked a magic potion. Temporary immunity activated for the next battle")
 
-        elif item._name.lower() == "binocular":
+        elif item_name_lc == "binocular":
             self.use_binocular()
-            self._inventory.remove(item) 
+            self._remove_from_inventory(item)
             print("Binocular has been removed from inventory after use.")
 
+    # Removes a used item from its inventory stack.
+    def _remove_from_inventory(self, item):
+        key = item._name_lc
+        stack = self._inventory[key]
+        stack.pop()
+        if not stack:
+            del self._inventory[key]
+
     # Provide information of the adjacent or current location to the player.
     def use_binocular(self):
 
@@ -297,12 +387,12 @@ class Pymon(Creature):
     def pick_item(self, name):
 
         # Looks for available items in the current location.
-        item = next((item for item in self.current_location.items if item._name.lower() == name.lower()), None)
+        item = self.current_location._items_by_name.get(name.lower())
         
         if item:
             if item.pick_up_items:
-                self._inventory.append(item)  
-                self.current_location.items.remove(item)  
+                self._inventory.setdefault(item._name_lc, []).append(item)
+                self.current_location.remove_item(item)  
                 print(f"{name} has been added to your inventory.")
             else:
                 print(f"{name} cannot be picked up.")
@@ -313,19 +403,17 @@ class Pymon(Creature):
     def show_inventory(self):
       
         if self._inventory:
-            print("Inventory items: ")
-            for item in self._inventory:
-                print(f" - {item._name}: {item._description}")
+            out = ["Inventory items: "]
+            for stack in self._inventory.values():
+                for item in stack:
+                    out.append(f" - {item._name}: {item._description}")
+            print('\n'.join(out))
         else:
             print("Unlucky. Your inventory is empty.")
 
     # Initiate battle between your pymon and the creature in your current location.
     def Challenge(self, creature_name):
-        opponent = None
-        for creature in self.current_location.creatures:
-            if creature.nickname == creature_name:
-                opponent = creature
-                break
+        opponent = self.current_location._creatures_by_name.get(creature_name.lower())
                 
         if opponent is None:
             print(f"{creature_name} is not available here.")
@@ -351,23 +439,22 @@ class Pymon(Creature):
         draw = 0
 
         while win < 2 and loss < 2 and self.energy > 0:
-            player_turn = input("\nChoose Rock, Paper, or Scissors: ").lower()
+            player_turn = _prompt("\nChoose Rock, Paper, or Scissors: ").lower()
+            player_idx = _RPS_INDEX.get(player_turn)
 
-            if player_turn not in ["rock", "paper", "scissors"]:
+            if player_idx is None:
                 print("Error: Invalid choice. Try again")
                 continue
             
-            opponent_turn = random.choice(["rock", "paper", "scissors"])
-            print(f"Opponent chose {opponent_turn}.")
+            opponent_idx = random.randrange(3)
+            print(f"Opponent chose {_RPS[opponent_idx]}.")
 
-            if player_turn == opponent_turn:
+            if player_idx == opponent_idx:
                 print("Draw, no one wins this encounter")
                 draw += 1
                 continue
 
-            elif (player_turn == "rock" and opponent_turn == "scissors") or \
-                (player_turn == "scissors" and opponent_turn == "paper") or \
-                (player_turn == "paper" and opponent_turn == "rock"):
+            elif (player_idx, opponent_idx) in _WIN:
                 print(f"Your Pymon {self.nickname} won this encounter!")
                 win += 1
             else:
@@ -389,14 +476,15 @@ class Pymon(Creature):
             )
             captured_pymon.energy = Pymon.enery_max  # Set full energy for new Pymon
             self.pets.append(captured_pymon)  # Add the new Pymon to pets
-            self.current_location.creatures.remove(opponent)  # Remove original creature
+            self.current_location.remove_creature(opponent)  # Remove original creature
 
         else:
             print(f"Lost the battle. {self.nickname} ran away into the wild.")
             
             if self.pets:
-                next_pymon = self.pets.pop(0)
-                next_pymon._inventory.extend(self._inventory)
+                next_pymon = self.pets.popleft()
+                for key, stack in self._inventory.items():
+                    next_pymon._inventory.setdefault(key, []).extend(stack)
                 self._inventory.clear()
                 print(f"{next_pymon.nickname} is now your primary Pymon.")
                 self.current_location = next_pymon.current_location
@@ -425,58 +513,78 @@ class Record:
         self.locations = []
         self.creatures = []
         self.items = []
+        self._loc_by_name = {} # Locations indexed by name
+
+    # Reads every row of a CSV file in one pass, with fields trimmed.
+    # Rows are cached until the file is modified.
+    def _read_rows(self, filename):
+        path = os.path.abspath(filename)
+        key = (path, os.stat(path).st_mtime_ns)
+        rows = _CSV_CACHE.get(key)
+        if rows is None:
+            with open(path, 'rb') as file:
+                text = file.read().decode('utf-8-sig') # Single read, byte-order mark dropped
+            # csv handles line endings itself so newlines inside quoted fields are kept.
+            reader = csv.reader(io.StringIO(text, newline=''), skipinitialspace=True)
+            rows = [[field.strip() for field in row] for row in reader]
+            _CSV_CACHE[key] = rows
+        return rows
 
     # Imports location data from a CSV file.
     def import_location(self, filename='locations.csv'):
         try:
-            with open(filename, 'r') as file:
-                header = next(file)
-                expected_columns = ['name', 'description', 'west', 'north', 'east', 'south']
-                
-                if not all(col.lower() in header.lower() for col in expected_columns):
-                    raise InvalidInputFileFormat(filename, "Missing required columns in header")
-                
-                for line_num, line in enumerate(file, 2):  
-                    parts = [x.strip() for x in line.split(',')]
+            rows = self._read_rows(filename)
+            header_cols = {col.lower() for col in rows[0]} if rows else set()
+            required = {'name', 'description', 'west', 'north', 'east', 'south'}
+
+            if not required.issubset(header_cols):
+                raise InvalidInputFileFormat(filename, "Missing required columns in header")
+
+            pending_connections = [] # (location, directions) resolved once all locations exist
+
+            for line_num, parts in enumerate(rows[1:], 2):
+                if not parts:
+                    continue
+
+                if len(parts) < 6:
+                    raise InvalidInputFileFormat(filename, 
+                        f"Line {line_num}: Expected 6 columns, got {len(parts)}")
+
+                try:
+                    
+                    name = parts[0]
+                    description = parts[1]
                     
-                    if len(parts) < 6:
+                    if not name or not description:
                         raise InvalidInputFileFormat(filename, 
-                            f"Line {line_num}: Expected 6 columns, got {len(parts)}")
+                            f"Line {line_num}: Name and description cannot be empty")
                     
-                    try:
-                        
-                        name = parts[0]
-                        description = parts[1]
-                        
-                        if not name or not description:
-                            raise InvalidInputFileFormat(filename, 
-                                f"Line {line_num}: Name and description cannot be empty")
-                        
-                        location = Location(name, description)
-                        self.locations.append(location)
-
-                       
-                        directions = {
+                    location = Location(name, description)
+                    self.locations.append(location)
+                    self._loc_by_name[name] = location
 
-                            'west': parts[2].replace("west =", "").strip(),
-                            'north': parts[3].replace("north =", "").strip(),
-                            'east': parts[4].replace("east =", "").strip(),
-                            'south': parts[5].replace("south =", "").strip()
-                        }
+                   
+                    directions = {
+
+                        'west': parts[2].replace("west =", "").strip(),
+                        'north': parts[3].replace("north =", "").strip(),
+                        'east': parts[4].replace("east =", "").strip(),
+                        'south': parts[5].replace("south =", "").strip()
+                    }
+                    pending_connections.append((location, directions))
+                
+                except Exception as e:
+                    raise InvalidInputFileFormat(filename, 
+                        f"Line {line_num}: Error processing location data - {str(e)}")
+
+            # Connects the locations, neighbours may be defined later in the file.
+            for location, directions in pending_connections:
+                for direction, connected_name in directions.items():
+                    if connected_name != "None":
+                        connected_location = self._loc_by_name.get(connected_name)
+                        if connected_location:
+                            location.connect(direction, connected_location)
                         
-                        for direction, connected_name in directions.items():
-                            if connected_name != "None":
-                                connected_location = next(
-                                    (loc for loc in self.locations if loc.name == connected_name), 
-                                    None
-                                )
-                                if connected_location:
-                                    location.connect(direction, connected_location)
-                    
-                    except Exception as e:
-                        raise InvalidInputFileFormat(filename, 
-                            f"Line {line_num}: Error processing location data - {str(e)}")
-                            
         except FileNotFoundError:
             print(f"Error: File '{filename}' not found")
             raise
@@ -496,41 +604,38 @@ class Record:
 
     # Imports creature data from a CSV file.
     def import_creatures(self, filename='creatures.csv'):
-       with open(filename, "r") as file:
-            next(file)  # Skip header
-            for line in file:
-                parts = [x.strip() for x in line.split(',')]
-                if len(parts) >= 3:
-                    nickname = parts[0].strip()
-                    description = parts[1].strip()
-                    adoptable = parts[2].strip().lower() == 'yes' 
-                    creature = Creature(nickname, description, None, adoptable)
-                    self.creatures.append(creature)
+        rows = self._read_rows(filename)
+        for parts in rows[1:]:  # Skip header
+            if len(parts) >= 3:
+                nickname = parts[0]
+                description = parts[1]
+                adoptable = parts[2].lower() == 'yes' 
+                creature = Creature(nickname, description, None, adoptable)
+                self.creatures.append(creature)
     pass     
 
     # Imports item data from a CSV file
     def import_items(self, filename='items.csv'):
         try:
-            with open(filename, "r") as file:
-                header = next(file)  
-                for line_num, line in enumerate(file, 2):  
-                    parts = [x.strip() for x in line.split(',')]
-                    
-                    
-                    if len(parts) < 4:
-                        raise InvalidInputFileFormat(filename, 
-                            f"Line {line_num}: Expected 4 columns, got {len(parts)}")
-                    
-                   
-                    name = parts[0]
-                    description = parts[1]
-                    pickable = parts[2].strip().lower() == 'yes'
-                    consumable = parts[3].strip().lower() == 'yes'
-                    
-                    
-                    item = Item(name, description, pickable, consumable)
-                    self.items.append(item)
-                    
+            rows = self._read_rows(filename)
+            for line_num, parts in enumerate(rows[1:], 2):
+                if not parts:
+                    continue
+
+                if len(parts) < 4:
+                    raise InvalidInputFileFormat(filename, 
+                        f"Line {line_num}: Expected 4 columns, got {len(parts)}")
+                
+               
+                name = parts[0]
+                description = parts[1]
+                pickable = parts[2].lower() == 'yes'
+                consumable = parts[3].lower() == 'yes'
+                
+                
+                item = Item(name, description, pickable, consumable)
+                self.items.append(item)
+                
                     
         except FileNotFoundError:
             print(f"Error: File '{filename}' not found.")
@@ -554,6 +659,22 @@ class Operation:
         self.locations = []
         self.current_pymon = Pymon("Kimimon")
 
+        # Menu choices mapped to their handlers.
+        self._menu = {
+            '1': self.inspect_pymon_menu,
+            '2': self.inspect_current_location,
+            '3': self.move_pymon,
+            '4': self.pick_item,
+            '5': self.check_inventory,
+            '6': self.challenge_creature,
+            '7': self.stats_generate,
+            '8': self._exit
+        }
+        self._pymon_menu = {
+            '1': self.inspect_pymon,
+            '2': self.select_benched_pymon
+        }
+
     # Displays and handles the main game menu.
     def handle_menu(self):
         while True:
@@ -567,27 +688,18 @@ class Operation:
             print("6) Challenge a creature")
             print("7) Generate stats")
             print("8) Exit the program")
-            user = input("Enter your choice: ")
-            if user == '1':
-                self.inspect_pymon_menu()
-            elif user == '2':
-                self.inspect_current_location()
-            elif user == '3':
-                self.move_pymon()
-            elif user == '4':
-                self.pick_item()
-            elif user == '5':
-                self.check_inventory()
-            elif user == '6':
-                self.challenge_creature()
-            elif user == '7':
-                self.stats_generate()
-            elif user == '8':
-                print("Exiting the game.")
-                sys.exit(0)
+            user = _prompt("Enter your choice: ")
+            handler = self._menu.get(user)
+            if handler:
+                handler()
             else:
                 print("Error: Please enter between 1 - 8")
 
+    # Exits the game.
+    def _exit(self):
+        print("Exiting the game.")
+        sys.exit(0)
+
     # Displays the submenu for inspecting the Pymon.
     def inspect_pymon_menu(self):
         
@@ -599,12 +711,12 @@ class Operation:
 
             user = input("Enter your choice: ")
 
-            if user == '1':
-                self.inspect_pymon()
-            elif user == '2':
-                self.select_benched_pymon()
-            elif user == '3':
+            if user == '3':
                 break
+
+            handler = self._pymon_menu.get(user)
+            if handler:
+                handler()
             else:
                 print("Error: Please enter a number between 1 and 3")
 
@@ -635,7 +747,8 @@ class Operation:
             if user == 0:
                 return
             
-            selected_pymon = self.current_pymon.pets.pop(user - 1)
+            selected_pymon = self.current_pymon.pets[user - 1]
+            del self.current_pymon.pets[user - 1]
             
             self.current_pymon.pets.append(self.current_pymon) 
             self.current_pymon = selected_pymon
@@ -648,22 +761,20 @@ class Operation:
     def inspect_current_location(self):
 
         location = self.current_pymon.get_location()
-        print("\nCurrent Location:", location.name)
-        print("Description:", location.description)
+        out = [f"\nCurrent Location: {location.name}", f"Description: {location.description}"]
 
-        print("Creatures here:")
-        for creature in location.creatures:
-            print(f" * {creature.nickname}")
+        out.append("Creatures here:")
+        out.extend(f" * {creature.nickname}" for creature in location.creatures)
 
-        print("Items available here:")
-        for item in location.items:
-            print(f" * {item._name}")
+        out.append("Items available here:")
+        out.extend(f" * {item._name}" for item in location.items)
+        print('\n'.join(out))
 
     # Move the pymon to different location.
     def move_pymon(self):
 
         try:
-            direction = input("Enter a direction to move (west, north, east, south): ")
+            direction = _prompt("Enter a direction to move (west, north, east, south): ")
             self.current_pymon.move(direction)
 
         except InvalidDirectionException as e:
@@ -691,20 +802,23 @@ class Operation:
             starting_location = random.choice(self.locations)
             self.current_pymon.spawn(starting_location)
 
+            # Draws every placement at once, enough for each item to be placed twice.
+            picks = iter(random.choices(self.locations, k=len(record.creatures) + 2 * len(record.items)))
+            duplicate_mask = [random.random() < 0.5 for _ in record.items]
+
             for creature in record.creatures:
-                random_location = random.choice(self.locations)
+                random_location = next(picks)
                 creature.location = random_location
                 random_location.add_creature(creature)
 
             
-            for item in record.items:
-                random_location = random.choice(self.locations)
+            for item, duplicate in zip(record.items, duplicate_mask):
+                random_location = next(picks)
                 random_location.add_item(item)
                 
-                if item.consumable and random.random() < 0.5:
-                    another_location = random.choice(self.locations)
-                    another_item = Item(item._name, item._description, item.pick_up_items, item.consumable)
-                    another_location.add_item(another_item)
+                if item.consumable and duplicate:
+                    another_location = next(picks)
+                    another_location.add_item(item) # Shared instance, picking removes it per location
             
 
         except (InvalidInputFileFormat, FileNotFoundError) as e:
@@ -734,7 +848,8 @@ class Operation:
             return
         
         print("\nInventory items:")
-        for idx, item in enumerate(self.current_pymon._inventory, start=1):
+        items = [item for stack in self.current_pymon._inventory.values() for item in stack]
+        for idx, item in enumerate(items, start=1):
             print(f"{idx}. {item._name} - {item._description}")
 
         use_item = input("\nWould you like to use an item? (yes/no): ").lower()